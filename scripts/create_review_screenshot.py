@@ -23,6 +23,7 @@ TARGET_H = 2796
 
 try:
     from PIL import Image
+    from resampling import resize
     
     # Open source
     src = Image.open(SOURCE)
@@ -39,7 +40,7 @@ try:
         new_height = TARGET_H - 200
         new_width = int(new_height * src_ratio)
     
-    src_resized = src.resize((new_width, new_height), Image.LANCZOS)
+    src_resized = resize(src, (new_width, new_height))
     
     # Center on canvas
     x_offset = (TARGET_W - new_width) // 2
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Diff visual entre a geração atual de screenshots/slides e a anterior.
+
+Compara cada PNG de <dir> com a cópia em <dir>/.baseline:
+  1. bytes idênticos                   → unchanged (sem decodificar)
+  2. dHash de miniatura (NumPy, lote)  → distância > --hash-threshold = changed
+  3. candidatos restantes              → diff pixel a pixel completo
+PNGs que só existem na baseline saem como removed.
+
+Gera <dir>/diff-report.json e, com --heatmaps, mapas de calor em
+<dir>/.diff/. O relatório guarda o md5 de cada arquivo e da baseline: o
+ios-screenshots.mjs confere o md5 contra o disco (relatório velho não vale)
+e só mantém no App Store o que já foi enviado com esse checksum.
+
+Uso:
+  python3 scripts/diff-shots.py screenshots-appstore
+  python3 scripts/diff-shots.py screenshots-appstore --heatmaps
+  python3 scripts/diff-shots.py screenshots-appstore --accept   # após o upload
+"""
+from PIL import Image
+from datetime import datetime, timezone
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+BASELINE = '.baseline'
+HEATMAPS = '.diff'
+REPORT   = 'diff-report.json'
+
+# Miniatura do dHash: HASH_SIZE linhas × HASH_SIZE+1 colunas → HASH_SIZE² bits
+HASH_SIZE = 16
+
+def list_pngs(root):
+    out = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in (BASELINE, HEATMAPS))
+        for f in sorted(filenames):
+            if f.lower().endswith('.png'):
+                out.append(os.path.relpath(os.path.join(dirpath, f), root).replace(os.sep, '/'))
+    return out
+
+def md5(path):
+    h = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def thumb(path):
+    img = Image.open(path).convert('L')
+    return img.size, np.asarray(img.resize((HASH_SIZE + 1, HASH_SIZE), Image.BOX), dtype=np.int16)
+
+def dhash_distance(new_thumbs, old_thumbs):
+    """Distância de Hamming do dHash para todos os pares de uma vez — (N,) int."""
+    a = np.stack(new_thumbs)
+    b = np.stack(old_thumbs)
+    ha = a[:, :, 1:] > a[:, :, :-1]
+    hb = b[:, :, 1:] > b[:, :, :-1]
+    return np.count_nonzero(ha != hb, axis=(1, 2))
+
+def pixel_delta(new_path, old_path):
+    """Maior diferença por canal em cada pixel — (H, W) uint8."""
+    a = np.asarray(Image.open(new_path).convert('RGB'), dtype=np.int16)
+    b = np.asarray(Image.open(old_path).convert('RGB'), dtype=np.int16)
+    return np.abs(a - b).max(axis=2).astype(np.uint8)
+
+def save_heatmap(new_path, delta, out_path):
+    # Fundo em cinza escurecido, diferença em vermelho proporcional ao delta
+    gray = np.asarray(Image.open(new_path).convert('L'), dtype=np.float32) * 0.35
+    heat = np.where(delta > 0, np.maximum(gray, 96 + delta.astype(np.float32) * (159 / 255)), gray)
+    rgb = np.stack([heat, gray, gray], axis=2).astype(np.uint8)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    Image.fromarray(rgb, 'RGB').save(out_path)
+
+def diff(root, hash_threshold, pixel_tolerance, heatmaps):
+    base = os.path.join(root, BASELINE)
+    files = {}
+    pending = []
+
+    current = list_pngs(root)
+    for rel in sorted(set(list_pngs(base)) - set(current)):
+        files[rel] = {'status': 'removed', 'baseline_md5': md5(os.path.join(base, rel))}
+
+    for rel in current:
+        new, old = os.path.join(root, rel), os.path.join(base, rel)
+        entry = files[rel] = {'md5': md5(new)}
+        if not os.path.exists(old):
+            entry['status'] = 'new'
+            continue
+        entry['baseline_md5'] = md5(old)
+        if entry['md5'] == entry['baseline_md5']:
+            entry['status'] = 'unchanged'
+            entry['identical'] = True
+        else:
+            pending.append(rel)
+
+    if pending:
+        new_t, old_t, sizes_ok = [], [], []
+        for rel in pending:
+            new_size, nt = thumb(os.path.join(root, rel))
+            old_size, ot = thumb(os.path.join(base, rel))
+            new_t.append(nt)
+            old_t.append(ot)
+            sizes_ok.append(new_size == old_size)
+        distances = dhash_distance(new_t, old_t)
+
+        for rel, dist, same_size in zip(pending, distances.tolist(), sizes_ok):
+            entry = files[rel]
+            entry['hash_distance'] = dist
+            if not same_size:
+                entry['status'] = 'changed'
+                entry['reason'] = 'size'
+                continue
+            if dist > hash_threshold and not heatmaps:
+                entry['status'] = 'changed'
+                continue
+            # Candidato (ou heatmap pedido): diff completo
+            new, old = os.path.join(root, rel), os.path.join(base, rel)
+            delta = pixel_delta(new, old)
+            changed = int(np.count_nonzero(delta > pixel_tolerance))
+            entry['changed_pixels'] = changed
+            entry['changed_ratio'] = round(changed / delta.size, 6)
+            entry['max_delta'] = int(delta.max())
+            entry['status'] = 'changed' if dist > hash_threshold or changed else 'unchanged'
+            if heatmaps and entry['status'] == 'changed':
+                out = os.path.join(root, HEATMAPS, rel)
+                save_heatmap(new, np.where(delta > pixel_tolerance, delta, 0), out)
+                entry['heatmap'] = os.path.relpath(out, root).replace(os.sep, '/')
+
+    files = dict(sorted(files.items()))
+    return {
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'baseline': BASELINE,
+        'hash_threshold': hash_threshold,
+        'pixel_tolerance': pixel_tolerance,
+        'files': files,
+        'unchanged': [rel for rel, e in files.items() if e['status'] == 'unchanged'],
+    }
+
+def accept(root):
+    """
+    Espelha a geração atual na baseline (rodar depois do upload): copia os
+    PNGs atuais e apaga os que não existem mais. Retorna (copiados, apagados).
+    """
+    base = os.path.join(root, BASELINE)
+    rels = list_pngs(root)
+    stale = sorted(set(list_pngs(base)) - set(rels))
+    for rel in rels:
+        dst = os.path.join(base, rel)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.copy2(os.path.join(root, rel), dst)
+    for rel in stale:
+        os.remove(os.path.join(base, rel))
+    # Pastas que ficaram vazias (ex.: device type removido)
+    for dirpath, dirnames, filenames in os.walk(base, topdown=False):
+        if dirpath != base and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+    return len(rels), len(stale)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Diff visual de screenshots/slides contra a geração anterior.')
+    parser.add_argument('dir', help='pasta com os PNGs gerados')
+    parser.add_argument('--hash-threshold', type=int, default=4,
+                        help=f'bits de dHash (de {HASH_SIZE * HASH_SIZE}) acima dos quais já é "changed"')
+    parser.add_argument('--pixel-tolerance', type=int, default=0,
+                        help='diferença por canal (0-255) ignorada no diff completo; '
+                             'padrão 0: qualquer pixel diferente conta como mudança')
+    parser.add_argument('--heatmaps', action='store_true', help=f'gera mapas de calor em {HEATMAPS}/')
+    parser.add_argument('--accept', action='store_true', help='atualiza a baseline com a geração atual')
+    args = parser.parse_args()
+
+    if args.accept:
+        copied, removed = accept(args.dir)
+        print(f'\n✓ Baseline atualizada ({copied} arquivo(s), {removed} removido(s)) em {os.path.join(args.dir, BASELINE)}\n')
+        raise SystemExit(0)
+
+    report = diff(args.dir, args.hash_threshold, args.pixel_tolerance, args.heatmaps)
+    with open(os.path.join(args.dir, REPORT), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    files = report['files']
+    print('\n🔍  IronTracks — Diff visual\n')
+    for rel, e in files.items():
+        if e['status'] == 'unchanged':
+            continue
+        extra = f"  dhash {e['hash_distance']}" if 'hash_distance' in e else ''
+        if 'changed_ratio' in e:
+            extra += f"  {e['changed_ratio'] * 100:.3f}% px"
+        mark = {'new': '+', 'removed': '-'}.get(e['status'], '~')
+        print(f"  {mark} {rel}{extra}")
+    n_unchanged = len(report['unchanged'])
+    n_removed = sum(e['status'] == 'removed' for e in files.values())
+    print(f'\n  {len(files) - n_unchanged - n_removed} alterado(s)/novo(s), {n_removed} removido(s), {n_unchanged} sem mudança')
+    print(f'  Relatório: {os.path.join(args.dir, REPORT)}\n')
@@ -1,16 +1,44 @@
 #!/usr/bin/env python3
 """
 IronTracks — Instagram Carousel Generator
-Gera 10 slides 1080x1080 para @irontrackscompany
+Gera 10 slides para @irontrackscompany em vários formatos numa só execução:
+feed 1080x1080, story 1080x1920 e promo App Store 1290x2796.
+
+Cada formato tem o próprio layout: no feed o mockup fica à esquerda e o
+texto à direita; nos formatos altos o mockup sobe centralizado e a coluna de
+texto é refluída embaixo dele, em escala maior. As partes caras (screenshot
+reamostrado, sombra com blur, logo) são renderizadas uma vez por tamanho em
+px e reaproveitadas entre formatos de mesma largura e entre locales — o feed
+sai igual independente de --formats. Sombras, molduras e gradientes alocam
+e misturam só o retângulo que tocam (Compositor); o log separa os px do
+fundo, do texto e das cópias por locale em cada slide.
+
+Textos vêm de carousel-locales.json (pt-BR, en, es…). Todos os locales
+saem no mesmo processo: partes do fundo, fontes, métricas de glifo e quebras de
+linha são compartilhados, e avisos de overflow saem dos layouts em cache.
+
+Uso:
+  python3 scripts/gen-carousel.py
+  python3 scripts/gen-carousel.py --formats feed,story --locales pt-BR,en
 """
 
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+import argparse
+import json
+import math
 import os
 import textwrap
 
+from resampling import resize
+
 BASE = '/Volumes/SSD NVME 512GB/Projetos Antigravity/App IronTracks'
 OUT  = f'{BASE}/instagram-carousel'
-os.makedirs(OUT, exist_ok=True)
+
+CATALOG        = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'carousel-locales.json')
+DEFAULT_LOCALE = 'pt-BR'
 
 # ── Cores ──────────────────────────────────────────────────────────
 BG        = (10, 10, 10)
@@ -22,35 +50,61 @@ GRAY      = (150, 150, 150)
 DARK_CARD = (22, 22, 22)
 ACCENT    = (201, 160, 34, 30)
 
+# Espaço de layout: todos os slides são desenhados em coordenadas 1080x1080
 SIZE = (1080, 1080)
+# Texto fora de [SAFE_MARGIN, 1080 - SAFE_MARGIN] gera aviso de overflow;
+# wrap_text com `limit` também avisa quando invade o bloco de baixo
+SAFE_MARGIN = 20
+
+# ── Formatos de saída ──────────────────────────────────────────────
+# Largura de layout é sempre 1080; a altura de layout de cada formato é
+# proporcional. Topbar ancora no topo e dots/handle no rodapé.
+FORMATS = {
+    'feed':     (1080, 1080),
+    'story':    (1080, 1920),
+    'appstore': (1290, 2796),
+}
+
+# Blocos do layout quadrado (x, y, largura, altura)
+MOCKUP = (46, 110, 440, 820)    # aparelho dos slides 2–9
+COLUMN = (590, 160, 470, 620)   # coluna de texto à direita do aparelho
+CENTER = (240, 120, 600, 780)   # conteúdo central dos slides 1 e 10
+
+# Formatos altos: fração da altura para o aparelho, respiros e margem lateral
+TALL_SHOT_SHARE = 0.42
+TALL_GAP        = 50
+TALL_FOOTER     = 90
+TALL_SIDE       = 60
+
+LOGO = f'{BASE}/Logo Nova IronTracks.png'
 
 FONT_REG  = '/System/Library/Fonts/HelveticaNeue.ttc'
 IDX_REG   = 0
 IDX_BOLD  = 1
 
+FontSpec = namedtuple('FontSpec', 'size bold')
+
 def fnt(size, bold=False):
+    # Tamanho em px de layout; cada Frame resolve na própria escala
+    return FontSpec(size, bold)
+
+@lru_cache(maxsize=None)
+def _truetype(size, bold):
     return ImageFont.truetype(FONT_REG, size, index=IDX_BOLD if bold else IDX_REG)
 
-def text_w(draw, text, font):
-    bb = draw.textbbox((0, 0), text, font=font)
-    return bb[2] - bb[0]
+@lru_cache(maxsize=None)
+def _bbox(text, size, bold):
+    return _truetype(size, bold).getbbox(text)
 
-def text_h(draw, text, font):
-    bb = draw.textbbox((0, 0), text, font=font)
-    return bb[3] - bb[1]
-
-def centered_text(draw, text, y, font, color=WHITE, width=1080):
-    w = text_w(draw, text, font)
-    draw.text(((width - w) // 2, y), text, fill=color, font=font)
-    return text_h(draw, text, font)
-
-def wrap_text(draw, text, x, y, font, color, max_width, line_spacing=8):
+@lru_cache(maxsize=None)
+def _break_lines(text, size, bold, max_px):
     words = text.split()
     lines = []
     current = ''
     for word in words:
         test = (current + ' ' + word).strip()
-        if text_w(draw, test, font) <= max_width:
+        l, _, r, _ = _bbox(test, size, bold)
+        if r - l <= max_px:
             current = test
         else:
             if current:
@@ -58,122 +112,392 @@ def wrap_text(draw, text, x, y, font, color, max_width, line_spacing=8):
             current = word
     if current:
         lines.append(current)
+    return tuple(lines)
+
+def text_w(draw, text, font):
+    bb = draw.textbbox((0, 0), text, font=font)
+    return bb[2] - bb[0]
+
+def text_h(draw, text, font):
+    bb = draw.textbbox((0, 0), text, font=font)
+    return bb[3] - bb[1]
+
+def centered_text(draw, text, y, font, color=WHITE, width=1080):
+    w = text_w(draw, text, font)
+    draw.text(((width - w) // 2, y), text, fill=color, font=font)
+    return text_h(draw, text, font)
 
+def wrap_text(draw, text, x, y, font, color, max_width, line_spacing=8, limit=None):
+    """
+    Desenha o texto quebrado em linhas e retorna o y final. Com `limit` (y
+    onde começa o bloco seguinte), avisa se a última linha passar dele.
+    """
     cy = y
-    for line in lines:
+    bottom = y
+    for line in draw.break_lines(text, font, max_width):
         draw.text((x, cy), line, fill=color, font=font)
+        bottom = draw.textbbox((x, cy), line, font=font)[3]
         cy += text_h(draw, line, font) + line_spacing
+    if limit is not None and bottom > limit:
+        draw.overflows.append((text, 'invade o bloco abaixo'))
     return cy
 
-def make_canvas():
-    img = Image.new('RGB', SIZE, BG)
-    return img
-
-def add_gold_glow(img, cx=540, cy=540, radius=320, intensity=0.12):
-    glow = Image.new('RGB', SIZE, (0, 0, 0))
-    draw = ImageDraw.Draw(glow)
-    for r in range(radius, 0, -4):
-        a = int(255 * intensity * (1 - r/radius))
-        draw.ellipse([cx-r, cy-r, cx+r, cy+r], fill=(201, 160, 34))
-    img = Image.blend(img, glow, intensity)
-    return img
-
-def add_bottom_gradient(img, start_y=700):
-    overlay = Image.new('RGBA', SIZE, (0, 0, 0, 0))
+# ── Compositing ────────────────────────────────────────────────────
+# Px processados desde o último reset_stats(), separados por etapa:
+#   art     compositing do fundo (glow, mockup, logo) — uma vez por formato
+#   text    texto e chrome desenhados por locale
+#   copy    cópia do fundo em cache para cada locale
+#   canvas  canvases de fundo alocados
+STATS = {'art': 0, 'text': 0, 'copy': 0, 'canvas': 0}
+
+def reset_stats():
+    for k in STATS:
+        STATS[k] = 0
+
+def count_pixels(box, kind):
+    STATS[kind] += max(0, box[2] - box[0]) * max(0, box[3] - box[1])
+
+class Compositor:
+    """
+    Canvas RGBA em que cada camada é alocada e misturada só no seu
+    retângulo sujo (clipado ao canvas), em vez de ocupar o canvas inteiro.
+    """
+    def __init__(self, size, color):
+        self.size = size
+        self.color = color
+        self.img = Image.new('RGBA', size, color)
+        self.dirty = []
+        STATS['canvas'] += size[0] * size[1]
+
+    def clip(self, box):
+        x0, y0 = max(0, int(box[0])), max(0, int(box[1]))
+        x1, y1 = min(self.size[0], int(box[2])), min(self.size[1], int(box[3]))
+        return (x0, y0, x1, y1) if x0 < x1 and y0 < y1 else None
+
+    def touch(self, box):
+        self.dirty.append(box)
+        count_pixels(box, 'art')
+
+    def layer(self, box):
+        """Camada transparente do tamanho de box (clipado) e sua origem no canvas."""
+        box = self.clip(box) or (0, 0, 0, 0)
+        return Image.new('RGBA', (box[2] - box[0], box[3] - box[1]), (0, 0, 0, 0)), box[:2]
+
+    def composite(self, layer, origin):
+        box = self.clip((*origin, origin[0] + layer.width, origin[1] + layer.height))
+        if box:
+            src = (box[0] - origin[0], box[1] - origin[1], box[2] - origin[0], box[3] - origin[1])
+            self.img.alpha_composite(layer, dest=box[:2], source=src)
+            self.touch(box)
+
+    def paste(self, im, origin, mask=None):
+        self.img.paste(im, origin, mask)
+        box = self.clip((*origin, origin[0] + im.width, origin[1] + im.height))
+        if box:
+            self.touch(box)
+
+    def dim(self, amount):
+        """
+        Image.blend com preto em todo o canvas. Fora dos retângulos sujos o
+        canvas é liso: troca a cor de fundo e mistura só os retângulos.
+        """
+        black = (0, 0, 0, 255)
+        px = Image.new('RGBA', (1, 1), self.color)
+        self.color = Image.blend(px, Image.new('RGBA', (1, 1), black), amount).getpixel((0, 0))
+        # Recortes saem todos do canvas antigo: retângulos sobrepostos não
+        # escurecem duas vezes
+        regions = []
+        for box in self.dirty:
+            region = self.img.crop(box)
+            regions.append((box, Image.blend(region, Image.new('RGBA', region.size, black), amount)))
+        # Repinta o canvas existente: nenhuma alocação além da de __init__
+        self.img.paste(self.color, (0, 0, *self.size))
+        self.dirty = []
+        for box, region in regions:
+            self.img.paste(region, box[:2])
+            self.touch(box)
+
+# ── Layout ─────────────────────────────────────────────────────────
+# Block leva coordenadas do quadrado para o formato:
+#   (x, y) → (bx + (x - ax)·k, by + (y - ay)·k)
+Block = namedtuple('Block', 'ax ay bx by k')
+IDENTITY = Block(0, 0, 0, 0, 1)
+
+@lru_cache(maxsize=None)
+def layout(fmt):
+    """Posições do aparelho e transformações dos blocos de texto no formato."""
+    w, h = FORMATS[fmt]
+    lh = h * SIZE[0] / w
+    if lh <= SIZE[1]:
+        return {'lh': lh, 'tall': False, 'shot': MOCKUP, 'k_shot': 1,
+                'column': IDENTITY, 'center': IDENTITY}
+
+    # Aparelho centralizado no topo, coluna refluída no espaço abaixo
+    k_shot = max(1, lh * TALL_SHOT_SHARE / MOCKUP[3])
+    sw, sh = MOCKUP[2] * k_shot, MOCKUP[3] * k_shot
+    top = MOCKUP[1] + sh + TALL_GAP
+    avail = lh - top - TALL_FOOTER
+    cx, cy, cw, ch = COLUMN
+    k = min(avail / ch, (SIZE[0] - 2 * TALL_SIDE) / cw)
+    column = Block(cx, cy, (SIZE[0] - cw * k) / 2, top + (avail - ch * k) / 2, k)
+
+    # Capa/CTA: conteúdo central ampliado em torno do próprio centro
+    x, y, cw, ch = CENTER
+    kc = min((lh - 2 * TALL_FOOTER) / ch, (SIZE[0] - 2 * TALL_SIDE) / cw)
+    center = Block(x + cw / 2, y + ch / 2, SIZE[0] / 2, lh / 2, kc)
+
+    return {'lh': lh, 'tall': True, 'shot': ((SIZE[0] - sw) / 2, MOCKUP[1], sw, sh),
+            'k_shot': k_shot, 'column': column, 'center': center}
+
+def apply(block, x, y):
+    return block.bx + (x - block.ax) * block.k, block.by + (y - block.ay) * block.k
+
+@lru_cache(maxsize=None)
+def _logo(width):
+    lg = Image.open(LOGO).convert('RGBA')
+    lw, lh = lg.size
+    s = width / lw
+    return resize(lg, (int(lw*s), int(lh*s)))
+
+@lru_cache(maxsize=None)
+def frame_art(fmt, glow=None, shot=None, logo=None):
+    """
+    Camadas caras de um slide (glow, mockup, logo) posicionadas no formato.
+    Em cache por (formato, glow, shot, logo): cada locale desenha numa cópia.
+    """
+    lay = layout(fmt)
+    size = FORMATS[fmt]
+    scale = size[0] / SIZE[0]
+    def px(v):
+        return round(v * scale)
+
+    comp = Compositor(size, (*BG, 255))
+    if glow:
+        cx, cy, radius, intensity = glow
+        if shot:
+            # Glow acompanha a altura do formato e o tamanho do aparelho
+            cy, radius = cy * lay['lh'] / SIZE[1], radius * lay['k_shot']
+        else:
+            b = lay['center']
+            (cx, cy), radius = apply(b, cx, cy), radius * b.k
+        add_gold_glow(comp, px(cx), px(cy), px(radius), intensity)
+    if shot:
+        x, y, w, h = lay['shot']
+        phone_mockup(comp, f'{BASE}/{shot}', px(x), px(y), px(w), px(h),
+                     scale * lay['k_shot'], center=lay['tall'])
+    if logo and os.path.exists(LOGO):
+        width, y = logo
+        b = lay['center']
+        lg = _logo(px(width * b.k))
+        comp.paste(lg, ((size[0]-lg.width)//2, px(apply(b, 0, y)[1])), lg)
+    # convert() aloca o fundo RGB que fica em cache: também é canvas
+    count_pixels((0, 0, *size), 'canvas')
+    return comp.img.convert('RGB')
+
+class Frame:
+    """
+    Canvas de um formato de saída com a interface de ImageDraw usada pelos
+    slides. Coordenadas, raios e fontes chegam em px do layout quadrado
+    (1080x1080) e passam pelo bloco ativo (coluna ou centro) do formato;
+    chrome é desenhado dentro de `with draw.chrome()`, sem bloco.
+    """
+    def __init__(self, fmt):
+        self.fmt = fmt
+        self.size = FORMATS[fmt]
+        self.scale = self.size[0] / SIZE[0]
+        self.layout = layout(fmt)
+        self.block = IDENTITY
+        self.img = None
+        self.overflows = []
+
+    def background(self, glow=None, shot=None, logo=None):
+        self.block = self.layout['column' if shot else 'center']
+        self.img = frame_art(self.fmt, glow, shot, logo).copy()
+        count_pixels((0, 0, *self.size), 'copy')
+        self._draw = ImageDraw.Draw(self.img)
+
+    @contextmanager
+    def chrome(self):
+        block, self.block = self.block, IDENTITY
+        try:
+            yield
+        finally:
+            self.block = block
+
+    # Âncoras de chrome: y de layout relativo ao topo / rodapé do formato
+    def top(self, y):
+        return y
+
+    def bottom(self, y):
+        return y + self.layout['lh'] - SIZE[1]
+
+    @property
+    def units(self):
+        # px de saída por unidade do layout quadrado no bloco ativo
+        return self.scale * self.block.k
+
+    def px(self, v):
+        return round(v * self.units)
+
+    def pt(self, x, y):
+        x, y = apply(self.block, x, y)
+        return round(x * self.scale), round(y * self.scale)
+
+    def box(self, b):
+        return [*self.pt(b[0], b[1]), *self.pt(b[2], b[3])]
+
+    def font(self, spec):
+        return _truetype(self.px(spec.size), spec.bold)
+
+    def textbbox(self, xy, text, font=None):
+        l, t, r, b = _bbox(text, self.px(font.size), font.bold)
+        x, y = xy
+        u = self.units
+        return (x + l / u, y + t / u, x + r / u, y + b / u)
+
+    def break_lines(self, text, font, max_width):
+        return _break_lines(text, self.px(font.size), font.bold, max_width * self.units)
+
+    def text(self, xy, text, fill=None, font=None):
+        l, t, r, b = self.textbbox(xy, text, font)
+        # Área segura medida no formato, depois da transformação do bloco
+        fl, fr = apply(self.block, l, 0)[0], apply(self.block, r, 0)[0]
+        if fl < SAFE_MARGIN or fr > SIZE[0] - SAFE_MARGIN:
+            self.overflows.append((text, 'fora da área segura'))
+        self._draw.text(self.pt(*xy), text, fill=fill, font=self.font(font))
+        count_pixels(self.box((l, t, r, b)), 'text')
+
+    def rectangle(self, b, fill=None):
+        self._draw.rectangle(self.box(b), fill=fill)
+        count_pixels(self.box(b), 'text')
+
+    def rounded_rectangle(self, b, radius=0, fill=None):
+        self._draw.rounded_rectangle(self.box(b), radius=self.px(radius), fill=fill)
+        count_pixels(self.box(b), 'text')
+
+    def ellipse(self, b, fill=None):
+        self._draw.ellipse(self.box(b), fill=fill)
+        count_pixels(self.box(b), 'text')
+
+    def save(self, path):
+        self.img.save(path)
+
+def add_gold_glow(comp, cx=540, cy=540, radius=320, intensity=0.12):
+    # blend(canvas, glow) = canvas escurecido fora do círculo + mistura com
+    # GOLD dentro: só o retângulo do círculo passa pelo blend
+    box = comp.clip([cx-radius, cy-radius, cx+radius+1, cy+radius+1])
+    if box:
+        region = comp.img.crop(box)
+        glow = Image.new('RGBA', region.size, (0, 0, 0, 255))
+        ImageDraw.Draw(glow).ellipse([cx-radius-box[0], cy-radius-box[1], cx+radius-box[0], cy+radius-box[1]], fill=GOLD)
+        region = Image.blend(region, glow, intensity)
+    comp.dim(intensity)
+    if box:
+        comp.paste(region, box[:2])
+
+def add_bottom_gradient(comp, start_y=700):
+    w, h = comp.size
+    overlay, origin = comp.layer([0, start_y, w, h])
     draw = ImageDraw.Draw(overlay)
-    for y in range(start_y, 1080):
-        alpha = int(200 * (y - start_y) / (1080 - start_y))
-        draw.line([(0, y), (1080, y)], fill=(10, 10, 10, alpha))
-    base = img.convert('RGBA')
-    result = Image.alpha_composite(base, overlay)
-    return result.convert('RGB')
+    for y in range(start_y, h):
+        alpha = int(200 * (y - start_y) / (h - start_y))
+        draw.line([(0, y - start_y), (w, y - start_y)], fill=(10, 10, 10, alpha))
+    comp.composite(overlay, origin)
 
 def draw_gold_line(draw, x1, y, x2, thick=3):
     draw.rectangle([x1, y, x2, y + thick], fill=GOLD)
 
-def phone_mockup(canvas, shot_path, x, y, w, h):
-    if not os.path.exists(shot_path):
-        return canvas
+@lru_cache(maxsize=None)
+def _mockup_parts(shot_path, w, h, scale):
+    """
+    Partes caras do mockup para um tamanho em px — screenshot reamostrado
+    com cantos arredondados, sombra com blur e moldura — reaproveitadas por
+    todo formato de mesma escala e por todos os locales.
+    """
     shot = Image.open(shot_path).convert('RGBA')
     sw, sh = shot.size
-    scale = min(w / sw, h / sh)
-    nw, nh = int(sw * scale), int(sh * scale)
-    shot = shot.resize((nw, nh), Image.LANCZOS)
-
-    radius = 36
-
-    # Shadow
-    shadow_layer = Image.new('RGBA', SIZE, (0, 0, 0, 0))
-    sd = ImageDraw.Draw(shadow_layer)
-    sd.rounded_rectangle([x+8, y+8, x+nw+8, y+nh+8], radius=radius, fill=(0, 0, 0, 140))
-    shadow_layer = shadow_layer.filter(ImageFilter.GaussianBlur(20))
-    canvas = canvas.convert('RGBA')
-    canvas = Image.alpha_composite(canvas, shadow_layer)
-
-    # Phone frame (gold border)
-    frame_layer = Image.new('RGBA', SIZE, (0, 0, 0, 0))
-    fd = ImageDraw.Draw(frame_layer)
-    fd.rounded_rectangle([x-3, y-3, x+nw+3, y+nh+3], radius=radius+3, fill=(*GOLD, 80))
-    canvas = Image.alpha_composite(canvas, frame_layer)
+    fit = min(w / sw, h / sh)
+    nw, nh = int(sw * fit), int(sh * fit)
+    shot = resize(shot, (nw, nh))
+
+    radius = round(36 * scale)
+    off    = round(8 * scale)
+    border = round(3 * scale)
+    blur   = 20 * scale
+
+    # Shadow — sprite do retângulo + alcance do blur
+    reach = math.ceil(3 * blur)
+    shadow = Image.new('RGBA', (nw + 2*reach + 1, nh + 2*reach + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(shadow).rounded_rectangle([reach, reach, reach+nw, reach+nh], radius=radius, fill=(0, 0, 0, 140))
+    shadow = shadow.filter(ImageFilter.GaussianBlur(blur))
+
+    # Phone frame (gold border) — sprite só do retângulo do aparelho
+    frame = Image.new('RGBA', (nw + 2*border + 1, nh + 2*border + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(frame).rounded_rectangle([0, 0, nw+2*border, nh+2*border], radius=radius+border, fill=(*GOLD, 80))
 
     # Screenshot with rounded mask
     mask = Image.new('L', (nw, nh), 0)
-    md = ImageDraw.Draw(mask)
-    md.rounded_rectangle([0, 0, nw, nh], radius=radius, fill=255)
+    ImageDraw.Draw(mask).rounded_rectangle([0, 0, nw, nh], radius=radius, fill=255)
     shot.putalpha(mask)
-    canvas.paste(shot, (x, y), shot)
 
-    return canvas.convert('RGB')
+    return shot, (shadow, off - reach), (frame, -border)
+
+def phone_mockup(comp, shot_path, x, y, w, h, scale=1, center=False):
+    if not os.path.exists(shot_path):
+        return
+    shot, (shadow, so), (frame, fo) = _mockup_parts(shot_path, w, h, scale)
+    if center:
+        x += (w - shot.width) // 2
+    comp.composite(shadow, (x + so, y + so))
+    comp.composite(frame, (x + fo, y + fo))
+    comp.paste(shot, (x, y), shot)
 
 def draw_dots(draw, current, total=10, y=1042):
-    dot_r = 5
-    gap = 18
-    total_w = total * (dot_r*2) + (total-1) * (gap - dot_r*2)
-    sx = (1080 - total_w) // 2
-    for i in range(total):
-        cx = sx + i * gap
-        if i == current:
-            draw.ellipse([cx, y, cx+dot_r*2, y+dot_r*2], fill=GOLD)
-        else:
-            draw.ellipse([cx, y, cx+dot_r*2, y+dot_r*2], fill=(55, 55, 55))
+    with draw.chrome():
+        y = draw.bottom(y)
+        dot_r = 5
+        gap = 18
+        total_w = total * (dot_r*2) + (total-1) * (gap - dot_r*2)
+        sx = (1080 - total_w) // 2
+        for i in range(total):
+            cx = sx + i * gap
+            if i == current:
+                draw.ellipse([cx, y, cx+dot_r*2, y+dot_r*2], fill=GOLD)
+            else:
+                draw.ellipse([cx, y, cx+dot_r*2, y+dot_r*2], fill=(55, 55, 55))
+
+def draw_gold_top(draw):
+    with draw.chrome():
+        draw.rectangle([0, draw.top(0), 1080, draw.top(4)], fill=GOLD)
 
 def draw_topbar(draw, label='', page=1, total=10):
-    # Logo mini
-    f = fnt(22, bold=True)
-    draw.text((48, 44), "IRON", fill=WHITE, font=f)
-    iw = text_w(draw, "IRON", f)
-    draw.text((48 + iw, 44), "TRACKS", fill=GOLD, font=f)
-    # Page number
-    fp = fnt(16)
-    pg_txt = f'{page}/{total}'
-    pw = text_w(draw, pg_txt, fp)
-    draw.text((1080 - 48 - pw, 49), pg_txt, fill=GRAY, font=fp)
-    # Gold top line
-    draw.rectangle([0, 0, 1080, 4], fill=GOLD)
+    with draw.chrome():
+        # Logo mini
+        f = fnt(22, bold=True)
+        draw.text((48, draw.top(44)), "IRON", fill=WHITE, font=f)
+        iw = text_w(draw, "IRON", f)
+        draw.text((48 + iw, draw.top(44)), "TRACKS", fill=GOLD, font=f)
+        # Page number
+        fp = fnt(16)
+        pg_txt = f'{page}/{total}'
+        pw = text_w(draw, pg_txt, fp)
+        draw.text((1080 - 48 - pw, draw.top(49)), pg_txt, fill=GRAY, font=fp)
+        # Gold top line
+        draw_gold_top(draw)
 
 def draw_ig_handle(draw, y=1022):
-    f = fnt(17)
-    txt = '@irontrackscompany'
-    w = text_w(draw, txt, f)
-    draw.text(((1080-w)//2, y), txt, fill=(90, 90, 90), font=f)
+    with draw.chrome():
+        f = fnt(17)
+        txt = '@irontrackscompany'
+        w = text_w(draw, txt, f)
+        draw.text(((1080-w)//2, draw.bottom(y)), txt, fill=(90, 90, 90), font=f)
 
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 1 — CAPA
 # ════════════════════════════════════════════════════════════════════
-def slide_01():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=540, cy=400, radius=400, intensity=0.18)
-    draw = ImageDraw.Draw(img)
-
-    # Logo
-    logo_path = f'{BASE}/Logo Nova IronTracks.png'
-    if os.path.exists(logo_path):
-        logo = Image.open(logo_path).convert('RGBA')
-        lw, lh = logo.size
-        scale = 260 / lw
-        logo = logo.resize((int(lw*scale), int(lh*scale)), Image.LANCZOS)
-        img.paste(logo, ((1080-logo.width)//2, 165), logo)
-        draw = ImageDraw.Draw(img)
+def slide_01(draw, t):
+    # Glow + logo
+    draw.background(glow=(540, 400, 400, 0.18), logo=(260, 165))
 
     # IRONTRACKS headline
     f_big = fnt(76, bold=True)
@@ -190,38 +514,27 @@ def slide_01():
     # Tagline
     f_tag = fnt(26, bold=True)
     f_sub = fnt(19)
-    line1 = "A PLATAFORMA FITNESS QUE VAI TE"
-    line2 = "FAZER QUEBRAR TODO REGISTRO"
-    centered_text(draw, line1, 606, f_tag, WHITE)
-    centered_text(draw, line2, 638, f_tag, GOLD_L)
+    centered_text(draw, t['tagline'][0], 606, f_tag, WHITE)
+    centered_text(draw, t['tagline'][1], 638, f_tag, GOLD_L)
 
     # Sub
-    centered_text(draw, "Treinos com IA · Comunidade · Evolução real", 692, f_sub, GRAY)
+    centered_text(draw, t['sub'], 692, f_sub, GRAY)
 
     # Swipe hint
     f_hint = fnt(17)
-    centered_text(draw, "deslize para descobrir  ›", 840, f_hint, (80, 80, 80))
+    centered_text(draw, t['hint'], 840, f_hint, (80, 80, 80))
 
-    draw.rectangle([0, 0, 1080, 4], fill=GOLD)
+    draw_gold_top(draw)
     draw_dots(draw, 0)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-01-capa.png')
-    print('✓ Slide 1: CAPA')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 2 — TREINOS COM IA
 # ════════════════════════════════════════════════════════════════════
-def slide_02():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=280, cy=540, radius=380, intensity=0.10)
-    draw = ImageDraw.Draw(img)
+def slide_02(draw, t):
+    draw.background(glow=(280, 540, 380, 0.10), shot='screenshot-dashboard.png')
     draw_topbar(draw, page=2)
 
-    # Phone mockup — left
-    img = phone_mockup(img, f'{BASE}/screenshot-dashboard.png', 46, 110, 440, 820)
-    draw = ImageDraw.Draw(img)
-
     # Right side content
     rx = 590
     f_label = fnt(14, bold=True)
@@ -229,355 +542,230 @@ def slide_02():
     f_sub   = fnt(22)
     f_body  = fnt(18)
 
-    draw.text((rx, 160), "FUNCIONALIDADE", fill=GOLD, font=f_label)
+    draw.text((rx, 160), t['label'], fill=GOLD, font=f_label)
     draw_gold_line(draw, rx, 188, rx+220, thick=2)
 
-    wrap_text(draw, "TREINOS CRIADOS", rx, 204, fnt(50, bold=True), WHITE, 470)
-    wrap_text(draw, "PELA IA EM", rx, 264, fnt(50, bold=True), WHITE, 470)
-    wrap_text(draw, "SEGUNDOS", rx, 324, fnt(50, bold=True), GOLD_L, 470)
+    wrap_text(draw, t['title'][0], rx, 204, fnt(50, bold=True), WHITE, 470, limit=264)
+    wrap_text(draw, t['title'][1], rx, 264, fnt(50, bold=True), WHITE, 470, limit=324)
+    wrap_text(draw, t['title'][2], rx, 324, fnt(50, bold=True), GOLD_L, 470, limit=398)
 
     draw_gold_line(draw, rx, 398, rx+180, thick=2)
 
-    items = [
-        "> Treino Express — pronto em 15 min",
-        "> Wizard — periodização inteligente",
-        "> Monte com objetivo e dias disponíveis",
-        "> IA aprende seus recordes e adapta",
-    ]
     cy = 418
-    for item in items:
-        draw.text((rx, cy), item, fill=GRAY, font=fnt(17))
+    for item in t['items']:
+        draw.text((rx, cy), f"> {item}", fill=GRAY, font=fnt(17))
         cy += 44
 
     draw_dots(draw, 1)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-02-treinos-ia.png')
-    print('✓ Slide 2: Treinos com IA')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 3 — IRON RANK & GAMIFICAÇÃO
 # ════════════════════════════════════════════════════════════════════
-def slide_03():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=800, cy=500, radius=360, intensity=0.11)
-    draw = ImageDraw.Draw(img)
+def slide_03(draw, t):
+    draw.background(glow=(800, 500, 360, 0.11), shot='screenshot-dashboard.png')
     draw_topbar(draw, page=3)
 
-    # Phone left
-    img = phone_mockup(img, f'{BASE}/screenshot-dashboard.png', 46, 110, 440, 820)
-    draw = ImageDraw.Draw(img)
-
     rx = 590
 
-    draw.text((rx, 160), "GAMIFICAÇÃO", fill=GOLD, font=fnt(14, bold=True))
+    draw.text((rx, 160), t['label'], fill=GOLD, font=fnt(14, bold=True))
     draw_gold_line(draw, rx, 188, rx+200, thick=2)
 
-    draw.text((rx, 204), "CADA KG", fill=WHITE, font=fnt(50, bold=True))
-    draw.text((rx, 264), "LEVANTADO", fill=WHITE, font=fnt(50, bold=True))
-    draw.text((rx, 324), "TE APROXIMA", fill=WHITE, font=fnt(44, bold=True))
-    draw.text((rx, 374), "DA LENDA", fill=GOLD_L, font=fnt(50, bold=True))
+    draw.text((rx, 204), t['title'][0], fill=WHITE, font=fnt(50, bold=True))
+    draw.text((rx, 264), t['title'][1], fill=WHITE, font=fnt(50, bold=True))
+    draw.text((rx, 324), t['title'][2], fill=WHITE, font=fnt(44, bold=True))
+    draw.text((rx, 374), t['title'][3], fill=GOLD_L, font=fnt(50, bold=True))
 
     draw_gold_line(draw, rx, 445, rx+170, thick=2)
 
-    ranks = [
-        ("> ", "Iniciante das Ferros"),
-        ("> ", "Veterano do Ferro"),
-        ("> ", "Mestre do Ferro"),
-        ("> ", "Lenda Imortal  ← topo"),
-    ]
     cy = 462
-    for icon, name in ranks:
-        draw.text((rx, cy), f"{icon}  {name}", fill=GRAY, font=fnt(17))
+    for name in t['ranks']:
+        draw.text((rx, cy), f">   {name}", fill=GRAY, font=fnt(17))
         cy += 42
 
-    draw.text((rx, cy+10), "Sistema exclusivo de ranking por", fill=(80,80,80), font=fnt(15))
-    draw.text((rx, cy+32), "volume total levantado", fill=(80,80,80), font=fnt(15))
+    draw.text((rx, cy+10), t['footer'][0], fill=(80,80,80), font=fnt(15))
+    draw.text((rx, cy+32), t['footer'][1], fill=(80,80,80), font=fnt(15))
 
     draw_dots(draw, 2)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-03-iron-rank.png')
-    print('✓ Slide 3: Iron Rank')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 4 — COMUNIDADE
 # ════════════════════════════════════════════════════════════════════
-def slide_04():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=800, cy=520, radius=360, intensity=0.10)
-    draw = ImageDraw.Draw(img)
+def slide_04(draw, t):
+    draw.background(glow=(800, 520, 360, 0.10), shot='screenshot-community.png')
     draw_topbar(draw, page=4)
 
-    img = phone_mockup(img, f'{BASE}/screenshot-community.png', 46, 110, 440, 820)
-    draw = ImageDraw.Draw(img)
-
     rx = 590
 
-    draw.text((rx, 160), "COMUNIDADE", fill=GOLD, font=fnt(14, bold=True))
+    draw.text((rx, 160), t['label'], fill=GOLD, font=fnt(14, bold=True))
     draw_gold_line(draw, rx, 188, rx+200, thick=2)
 
-    draw.text((rx, 204), "SEU TREINO", fill=WHITE, font=fnt(50, bold=True))
-    draw.text((rx, 264), "TEM PLATEIA", fill=GOLD_L, font=fnt(50, bold=True))
+    draw.text((rx, 204), t['title'][0], fill=WHITE, font=fnt(50, bold=True))
+    draw.text((rx, 264), t['title'][1], fill=GOLD_L, font=fnt(50, bold=True))
 
     draw_gold_line(draw, rx, 334, rx+170, thick=2)
 
-    wrap_text(draw, "Veja o que seus amigos estão quebrando. Inspire. Seja inspirado.", rx, 354, fnt(20), GRAY, 440, line_spacing=10)
+    wrap_text(draw, t['body'], rx, 354, fnt(20), GRAY, 440, line_spacing=10, limit=490)
 
     cy = 490
-    feats = [
-        "> Feed de atividades em tempo real",
-        "> Rankings globais e entre amigos",
-        "> Desafios com recompensas",
-        "> Siga atletas e personal trainers",
-        "> Recordes pessoais celebrados",
-    ]
-    for f in feats:
-        draw.text((rx, cy), f, fill=GRAY, font=fnt(17))
+    for f in t['items']:
+        draw.text((rx, cy), f"> {f}", fill=GRAY, font=fnt(17))
         cy += 44
 
     draw_dots(draw, 3)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-04-comunidade.png')
-    print('✓ Slide 4: Comunidade')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 5 — NUTRIÇÃO
 # ════════════════════════════════════════════════════════════════════
-def slide_05():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=800, cy=500, radius=360, intensity=0.10)
-    draw = ImageDraw.Draw(img)
+def slide_05(draw, t):
+    draw.background(glow=(800, 500, 360, 0.10), shot='screenshot-nutrition.png')
     draw_topbar(draw, page=5)
 
-    img = phone_mockup(img, f'{BASE}/screenshot-nutrition.png', 46, 110, 440, 820)
-    draw = ImageDraw.Draw(img)
-
     rx = 590
 
-    draw.text((rx, 160), "NUTRIÇÃO", fill=GOLD, font=fnt(14, bold=True))
+    draw.text((rx, 160), t['label'], fill=GOLD, font=fnt(14, bold=True))
     draw_gold_line(draw, rx, 188, rx+190, thick=2)
 
-    draw.text((rx, 204), "CONTROLE", fill=WHITE, font=fnt(50, bold=True))
-    draw.text((rx, 264), "SEUS MACROS", fill=WHITE, font=fnt(44, bold=True))
-    draw.text((rx, 314), "COM PRECISÃO", fill=GOLD_L, font=fnt(44, bold=True))
+    draw.text((rx, 204), t['title'][0], fill=WHITE, font=fnt(50, bold=True))
+    draw.text((rx, 264), t['title'][1], fill=WHITE, font=fnt(44, bold=True))
+    draw.text((rx, 314), t['title'][2], fill=GOLD_L, font=fnt(44, bold=True))
 
     draw_gold_line(draw, rx, 378, rx+170, thick=2)
 
-    wrap_text(draw, "Meta de calorias calculada automaticamente pelo seu TDEE.", rx, 398, fnt(19), GRAY, 440, line_spacing=8)
+    wrap_text(draw, t['body'], rx, 398, fnt(19), GRAY, 440, line_spacing=8, limit=490)
 
     cy = 490
-    macros = [
-        ("> ", "Calorias", "Meta personalizada por TDEE"),
-        ("> ", "Proteína", "Metas por peso corporal"),
-        ("> ", "Carboidratos", "Ajuste por objetivo"),
-        ("> ", "Gordura", "Controle total dos macros"),
-    ]
-    for icon, name, desc in macros:
-        draw.text((rx, cy), f"{icon}  {name}", fill=WHITE, font=fnt(18, bold=True))
+    for name, desc in t['macros']:
+        draw.text((rx, cy), f">   {name}", fill=WHITE, font=fnt(18, bold=True))
         draw.text((rx + 160, cy + 2), f"— {desc}", fill=(90,90,90), font=fnt(15))
         cy += 44
 
-    draw.text((rx, cy+14), "Gráfico Treino × Nutrição — 30 dias", fill=(70,70,70), font=fnt(15))
+    draw.text((rx, cy+14), t['footer'], fill=(70,70,70), font=fnt(15))
 
     draw_dots(draw, 4)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-05-nutricao.png')
-    print('✓ Slide 5: Nutrição')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 6 — AVALIAÇÕES & EVOLUÇÃO
 # ════════════════════════════════════════════════════════════════════
-def slide_06():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=800, cy=500, radius=360, intensity=0.10)
-    draw = ImageDraw.Draw(img)
+def slide_06(draw, t):
+    draw.background(glow=(800, 500, 360, 0.10), shot='screenshot-assessments.png')
     draw_topbar(draw, page=6)
 
-    img = phone_mockup(img, f'{BASE}/screenshot-assessments.png', 46, 110, 440, 820)
-    draw = ImageDraw.Draw(img)
-
     rx = 590
 
-    draw.text((rx, 160), "AVALIAÇÕES", fill=GOLD, font=fnt(14, bold=True))
+    draw.text((rx, 160), t['label'], fill=GOLD, font=fnt(14, bold=True))
     draw_gold_line(draw, rx, 188, rx+200, thick=2)
 
-    draw.text((rx, 204), "EVOLUÇÃO", fill=WHITE, font=fnt(52, bold=True))
-    draw.text((rx, 264), "VISÍVEL EM", fill=WHITE, font=fnt(52, bold=True))
-    draw.text((rx, 324), "CADA DETALHE", fill=GOLD_L, font=fnt(44, bold=True))
+    draw.text((rx, 204), t['title'][0], fill=WHITE, font=fnt(52, bold=True))
+    draw.text((rx, 264), t['title'][1], fill=WHITE, font=fnt(52, bold=True))
+    draw.text((rx, 324), t['title'][2], fill=GOLD_L, font=fnt(44, bold=True))
 
     draw_gold_line(draw, rx, 390, rx+170, thick=2)
 
-    wrap_text(draw, "Documente sua jornada. Números não mentem.", rx, 410, fnt(20), GRAY, 440)
+    wrap_text(draw, t['body'], rx, 410, fnt(20), GRAY, 440, limit=478)
 
     cy = 478
-    metrics = [
-        ("> ", "Peso corporal"),
-        ("> ", "% de Gordura"),
-        ("> ", "Massa Magra"),
-        ("> ", "BMR (Taxa metabólica basal)"),
-        ("> ", "Import por foto ou PDF"),
-    ]
-    for icon, label in metrics:
-        draw.text((rx, cy), f"{icon} {label}", fill=GRAY, font=fnt(18))
+    for label in t['items']:
+        draw.text((rx, cy), f">  {label}", fill=GRAY, font=fnt(18))
         cy += 44
 
     draw_dots(draw, 5)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-06-avaliacoes.png')
-    print('✓ Slide 6: Avaliações')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 7 — VIP ELITE
 # ════════════════════════════════════════════════════════════════════
-def slide_07():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=800, cy=500, radius=400, intensity=0.14)
-    draw = ImageDraw.Draw(img)
+def slide_07(draw, t):
+    draw.background(glow=(800, 500, 400, 0.14), shot='screenshot-vip2.png')
     draw_topbar(draw, page=7)
 
-    img = phone_mockup(img, f'{BASE}/screenshot-vip2.png', 46, 110, 440, 820)
-    draw = ImageDraw.Draw(img)
-
     rx = 590
 
-    draw.text((rx, 160), "VIP ELITE", fill=GOLD, font=fnt(14, bold=True))
+    draw.text((rx, 160), t['label'], fill=GOLD, font=fnt(14, bold=True))
     draw_gold_line(draw, rx, 188, rx+200, thick=2)
 
-    draw.text((rx, 204), "ACESSO AO", fill=WHITE, font=fnt(52, bold=True))
-    draw.text((rx, 264), "NÍVEL MÁXIMO", fill=WHITE, font=fnt(48, bold=True))
-    draw.text((rx, 320), "DO APP", fill=GOLD_L, font=fnt(52, bold=True))
+    draw.text((rx, 204), t['title'][0], fill=WHITE, font=fnt(52, bold=True))
+    draw.text((rx, 264), t['title'][1], fill=WHITE, font=fnt(48, bold=True))
+    draw.text((rx, 320), t['title'][2], fill=GOLD_L, font=fnt(52, bold=True))
 
     draw_gold_line(draw, rx, 388, rx+170, thick=2)
 
     cy = 408
-    vips = [
-        ("> ", "Coach IA — sessões ilimitadas"),
-        ("> ", "Wizard — treinos periodizados"),
-        ("> ", "Insights avançados de PRs"),
-        ("> ", "Nutrição sem limites"),
-        ("> ", "Histórico completo de treinos"),
-        ("> ", "Tudo sem restrição"),
-    ]
-    for icon, label in vips:
-        draw.text((rx, cy), f"{icon}  {label}", fill=GRAY, font=fnt(17))
+    for label in t['items']:
+        draw.text((rx, cy), f">   {label}", fill=GRAY, font=fnt(17))
         cy += 44
 
     draw_dots(draw, 6)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-07-vip.png')
-    print('✓ Slide 7: VIP Elite')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 8 — COACH IA
 # ════════════════════════════════════════════════════════════════════
-def slide_08():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=800, cy=500, radius=360, intensity=0.11)
-    draw = ImageDraw.Draw(img)
+def slide_08(draw, t):
+    draw.background(glow=(800, 500, 360, 0.11), shot='screenshot-vip2.png')
     draw_topbar(draw, page=8)
 
-    img = phone_mockup(img, f'{BASE}/screenshot-vip2.png', 46, 110, 440, 820)
-    draw = ImageDraw.Draw(img)
-
     rx = 590
 
-    draw.text((rx, 160), "INTELIGÊNCIA ARTIFICIAL", fill=GOLD, font=fnt(13, bold=True))
+    draw.text((rx, 160), t['label'], fill=GOLD, font=fnt(13, bold=True))
     draw_gold_line(draw, rx, 184, rx+260, thick=2)
 
-    draw.text((rx, 200), "UM COACH IA", fill=WHITE, font=fnt(46, bold=True))
-    draw.text((rx, 254), "DISPONÍVEL", fill=WHITE, font=fnt(46, bold=True))
-    draw.text((rx, 308), "24 HORAS", fill=GOLD_L, font=fnt(52, bold=True))
-    draw.text((rx, 368), "POR DIA", fill=WHITE, font=fnt(46, bold=True))
+    draw.text((rx, 200), t['title'][0], fill=WHITE, font=fnt(46, bold=True))
+    draw.text((rx, 254), t['title'][1], fill=WHITE, font=fnt(46, bold=True))
+    draw.text((rx, 308), t['title'][2], fill=GOLD_L, font=fnt(52, bold=True))
+    draw.text((rx, 368), t['title'][3], fill=WHITE, font=fnt(46, bold=True))
 
     draw_gold_line(draw, rx, 430, rx+170, thick=2)
 
-    wrap_text(draw, "Pergunte sobre treino, nutrição, sobrecarga, exercícios. A IA responde com base no SEU histórico.", rx, 450, fnt(18), GRAY, 440, line_spacing=8)
+    wrap_text(draw, t['body'], rx, 450, fnt(18), GRAY, 440, line_spacing=8, limit=572)
 
     cy = 572
-    feats = [
-        "> Respostas personalizadas ao seu perfil",
-        "> Análise dos seus PRs e fraquezas",
-        "> Sugestão de cargas e progressão",
-        "> Chat ilimitado no plano VIP",
-    ]
-    for f in feats:
-        draw.text((rx, cy), f, fill=GRAY, font=fnt(17))
+    for f in t['items']:
+        draw.text((rx, cy), f"> {f}", fill=GRAY, font=fnt(17))
         cy += 44
 
     draw_dots(draw, 7)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-08-coach-ia.png')
-    print('✓ Slide 8: Coach IA')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 9 — PARA PROFESSORES
 # ════════════════════════════════════════════════════════════════════
-def slide_09():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=800, cy=500, radius=360, intensity=0.10)
-    draw = ImageDraw.Draw(img)
+def slide_09(draw, t):
+    draw.background(glow=(800, 500, 360, 0.10), shot='screenshot-professores.png')
     draw_topbar(draw, page=9)
 
-    img = phone_mockup(img, f'{BASE}/screenshot-professores.png', 46, 110, 440, 820)
-    draw = ImageDraw.Draw(img)
-
     rx = 590
 
-    draw.text((rx, 160), "PARA PROFESSORES", fill=GOLD, font=fnt(13, bold=True))
+    draw.text((rx, 160), t['label'], fill=GOLD, font=fnt(13, bold=True))
     draw_gold_line(draw, rx, 184, rx+260, thick=2)
 
-    draw.text((rx, 200), "VOCÊ É", fill=WHITE, font=fnt(56, bold=True))
-    draw.text((rx, 264), "PROFESSOR?", fill=GOLD_L, font=fnt(50, bold=True))
+    draw.text((rx, 200), t['title'][0], fill=WHITE, font=fnt(56, bold=True))
+    draw.text((rx, 264), t['title'][1], fill=GOLD_L, font=fnt(50, bold=True))
 
     draw_gold_line(draw, rx, 330, rx+170, thick=2)
 
-    wrap_text(draw, "Gerencie seus alunos, envie treinos e acompanhe a evolução de cada um — tudo num só lugar.", rx, 350, fnt(19), GRAY, 440, line_spacing=8)
+    wrap_text(draw, t['body'], rx, 350, fnt(19), GRAY, 440, line_spacing=8, limit=480)
 
     cy = 480
-    feats = [
-        "> Envie treinos personalizados",
-        "> Acompanhe evolução de cada aluno",
-        "> Acesso ao histórico e PRs do aluno",
-        "> Agenda de sessões integrada",
-        "> Até 34+ professores na plataforma",
-        "> Planos a partir de R$49/mês",
-    ]
-    for f in feats:
-        draw.text((rx, cy), f, fill=GRAY, font=fnt(17))
+    for f in t['items']:
+        draw.text((rx, cy), f"> {f}", fill=GRAY, font=fnt(17))
         cy += 44
 
     draw_dots(draw, 8)
     draw_ig_handle(draw)
 
-    img.save(f'{OUT}/slide-09-professores.png')
-    print('✓ Slide 9: Para Professores')
-
 # ════════════════════════════════════════════════════════════════════
 # SLIDE 10 — CTA
 # ════════════════════════════════════════════════════════════════════
-def slide_10():
-    img = make_canvas()
-    img = add_gold_glow(img, cx=540, cy=420, radius=500, intensity=0.20)
-    draw = ImageDraw.Draw(img)
+def slide_10(draw, t):
+    # Glow + logo
+    draw.background(glow=(540, 420, 500, 0.20), logo=(160, 120))
 
     # Gold top line
-    draw.rectangle([0, 0, 1080, 4], fill=GOLD)
-
-    # Logo
-    logo_path = f'{BASE}/Logo Nova IronTracks.png'
-    if os.path.exists(logo_path):
-        logo = Image.open(logo_path).convert('RGBA')
-        lw, lh = logo.size
-        scale = 160 / lw
-        logo = logo.resize((int(lw*scale), int(lh*scale)), Image.LANCZOS)
-        img.paste(logo, ((1080-logo.width)//2, 120), logo)
-        draw = ImageDraw.Draw(img)
+    draw_gold_top(draw)
 
     # Main CTA
     f_cta = fnt(78, bold=True)
@@ -585,24 +773,24 @@ def slide_10():
     f_body = fnt(22)
     f_sm = fnt(18)
 
-    centered_text(draw, "SEU PRÓXIMO", 330, f_cta, WHITE)
-    centered_text(draw, "NÍVEL", 416, f_cta, WHITE)
+    centered_text(draw, t['title'][0], 330, f_cta, WHITE)
+    centered_text(draw, t['title'][1], 416, f_cta, WHITE)
 
     # Gold bar under NÍVEL
     draw_gold_line(draw, 300, 510, 780, thick=5)
 
-    centered_text(draw, "COMEÇA AGORA", 528, f_sub, GOLD_L)
+    centered_text(draw, t['sub'], 528, f_sub, GOLD_L)
 
     # Separator dots
     centered_text(draw, "· · ·", 584, fnt(22), (60, 60, 60))
 
     # Sub lines
-    centered_text(draw, "Baixe grátis. Treine diferente. Quebre seus limites.", 618, f_body, GRAY)
+    centered_text(draw, t['body'], 618, f_body, GRAY)
 
     # Gold button mockup
     bx, by, bw, bh = 290, 688, 500, 68
     draw.rounded_rectangle([bx, by, bx+bw, by+bh], radius=34, fill=GOLD)
-    btn_txt = "BAIXAR GRÁTIS — iOS & ANDROID"
+    btn_txt = t['button']
     btn_f = fnt(20, bold=True)
     bw_txt = text_w(draw, btn_txt, btn_f)
     draw.text(((1080-bw_txt)//2, by+20), btn_txt, fill=(10, 10, 10), font=btn_f)
@@ -612,26 +800,84 @@ def slide_10():
     centered_text(draw, "irontracks.com.br", 824, fnt(18), GRAY)
 
     # Bottom tagline
-    centered_text(draw, "Alta Performance. Toda Sessão.", 880, fnt(16), (60, 60, 60))
+    centered_text(draw, t['tagline'], 880, fnt(16), (60, 60, 60))
 
     draw_dots(draw, 9)
 
-    img.save(f'{OUT}/slide-10-cta.png')
-    print('✓ Slide 10: CTA')
-
 # ════════════════════════════════════════════════════════════════════
 # MAIN
 # ════════════════════════════════════════════════════════════════════
+SLIDES = [
+    (slide_01, 'slide-01-capa',         'Slide 1: CAPA'),
+    (slide_02, 'slide-02-treinos-ia',   'Slide 2: Treinos com IA'),
+    (slide_03, 'slide-03-iron-rank',    'Slide 3: Iron Rank'),
+    (slide_04, 'slide-04-comunidade',   'Slide 4: Comunidade'),
+    (slide_05, 'slide-05-nutricao',     'Slide 5: Nutrição'),
+    (slide_06, 'slide-06-avaliacoes',   'Slide 6: Avaliações'),
+    (slide_07, 'slide-07-vip',          'Slide 7: VIP Elite'),
+    (slide_08, 'slide-08-coach-ia',     'Slide 8: Coach IA'),
+    (slide_09, 'slide-09-professores',  'Slide 9: Para Professores'),
+    (slide_10, 'slide-10-cta',          'Slide 10: CTA'),
+]
+
+def load_catalog(path):
+    with open(path, encoding='utf-8') as f:
+        catalog = json.load(f)
+    base = catalog[DEFAULT_LOCALE]
+    # Chave ausente num locale cai no texto pt-BR
+    return {
+        loc: {key: {**base[key], **strings.get(key, {})} for key in base}
+        for loc, strings in catalog.items()
+    }
+
+def out_dir(locale, fmt):
+    # pt-BR/feed continua na raiz para não quebrar quem já consome os slides
+    d = OUT if locale == DEFAULT_LOCALE else f'{OUT}/{locale}'
+    return d if fmt == 'feed' else f'{d}/{fmt}'
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gera o carousel do Instagram.')
+    parser.add_argument('--formats', default=','.join(FORMATS),
+                        help=f'formatos separados por vírgula ({", ".join(FORMATS)})')
+    parser.add_argument('--catalog', default=CATALOG, help='catálogo de textos por locale (JSON)')
+    parser.add_argument('--locales', default='',
+                        help='locales separados por vírgula (padrão: todos do catálogo)')
+    args = parser.parse_args()
+    catalog = load_catalog(args.catalog)
+    formats = [f.strip() for f in args.formats.split(',') if f.strip()]
+    locales = [l.strip() for l in args.locales.split(',') if l.strip()] or list(catalog)
+    unknown = [f for f in formats if f not in FORMATS] + [l for l in locales if l not in catalog]
+    if unknown:
+        parser.error(f'formato/locale desconhecido: {", ".join(unknown)}')
+
+    for locale in locales:
+        for fmt in formats:
+            os.makedirs(out_dir(locale, fmt), exist_ok=True)
+
     print('\n🎨  IronTracks — Gerando carousel Instagram...\n')
-    slide_01()
-    slide_02()
-    slide_03()
-    slide_04()
-    slide_05()
-    slide_06()
-    slide_07()
-    slide_08()
-    slide_09()
-    slide_10()
-    print(f'\n✅  10 slides gerados em:\n    {OUT}\n')
+    print(f'    formatos {", ".join(formats)}')
+    print(f'    locales {", ".join(locales)}\n')
+    overflows = {}
+    for slide, name, label in SLIDES:
+        reset_stats()
+        # Slide por fora: as partes caras do slide são reaproveitadas por todo locale/formato
+        for locale in locales:
+            for fmt in formats:
+                draw = Frame(fmt)
+                slide(draw, catalog[locale][slide.__name__])
+                draw.save(f'{out_dir(locale, fmt)}/{name}.png')
+                for text, reason in draw.overflows:
+                    overflows.setdefault((locale, name, text, reason), []).append(fmt)
+        # Fundo do slide não volta nos próximos; libera a memória
+        frame_art.cache_clear()
+        print(f"✓ {label}  (arte {STATS['art'] / 1e6:.1f} · texto {STATS['text'] / 1e6:.1f} · "
+              f"cópias do fundo {STATS['copy'] / 1e6:.1f} Mpx; {STATS['canvas'] / 1e6:.1f} Mpx de canvas)")
+
+    if overflows:
+        print(f'\n⚠️   {len(overflows)} texto(s) com overflow:')
+        for (locale, name, text, reason), fmts in overflows.items():
+            print(f'    [{locale}] {name} ({", ".join(fmts)}) {reason}: "{text}"')
+
+    m = _bbox.cache_info()
+    print(f'\n    métricas de glifo em cache: {m.hits} hits / {m.misses} misses')
+    print(f'\n✅  {len(SLIDES)} slides × {len(locales)} locales × {len(formats)} formatos gerados em:\n    {OUT}\n')
@@ -3,10 +3,15 @@
  * IronTracks — Upload screenshots to App Store Connect (sem Xcode UI).
  *
  * Pré-requisito: rodar scripts/scale-appstore-shots.py antes.
+ * Screenshots já no set com o mesmo md5 (sourceFileChecksum) e entrega
+ * COMPLETE não são reenviados. Opcional: scripts/diff-shots.py
+ * screenshots-appstore gera diff-report.json; um arquivo que o diff marcou
+ * como unchanged também mantém o envio da baseline (md5 conferido no disco).
  *
  * Usage:
  *   node scripts/ios-screenshots.mjs
  *   node scripts/ios-screenshots.mjs --dry-run
+ *   node scripts/ios-screenshots.mjs --force      # reenvia tudo
  */
 
 import { readFile, existsSync, statSync, mkdirSync } from 'node:fs'
@@ -20,6 +25,7 @@ const readFileAsync = promisify(readFile)
 const BASE   = path.resolve(import.meta.dirname, '..')
 const SCALED = path.join(BASE, 'screenshots-appstore')
 const DRY    = process.argv.includes('--dry-run')
+const FORCE  = process.argv.includes('--force')
 
 // ─── Env ───────────────────────────────────────────────────────────────────
 const envText = await readFileAsync(path.join(BASE, '.env.local'), 'utf8').catch(() => '')
@@ -52,6 +58,23 @@ const SHOT_FILES = [
     'screenshot-nutrition.png',
 ]
 
+// ─── Diff report (scripts/diff-shots.py) ───────────────────────────────────
+const diffReport = FORCE ? null : await readFileAsync(path.join(SCALED, 'diff-report.json'), 'utf8')
+    .then(JSON.parse).catch(() => null)
+
+async function fileMd5(filePath) {
+    return crypto.createHash('md5').update(await readFileAsync(filePath)).digest('hex')
+}
+
+// Checksums remotos aceitos para o arquivo local: o próprio md5 e, se o diff
+// marcou como unchanged um relatório que ainda bate com o disco, o da baseline
+function acceptedChecksums(rel, md5) {
+    const entry = diffReport?.files?.[rel]
+    const sums = new Set([md5])
+    if (entry?.status === 'unchanged' && entry.md5 === md5 && entry.baseline_md5) sums.add(entry.baseline_md5)
+    return sums
+}
+
 // ─── JWT ───────────────────────────────────────────────────────────────────
 const keyPem = await readFileAsync(KEY_PATH, 'utf8')
 
@@ -107,9 +130,20 @@ async function uploadBinary(uploadOps, filePath) {
     return true
 }
 
+// Ordem do set no App Store = ordem de SHOT_FILES; PATCH só se diferir
+async function syncOrder(setId, order, remoteOrder) {
+    if (order.length === remoteOrder.length && order.every((id, i) => id === remoteOrder[i])) return
+    // api() já loga erros; 204 também volta null
+    await api('PATCH', `/v1/appScreenshotSets/${setId}/relationships/appScreenshots`, {
+        data: order.map(id => ({ type: 'appScreenshots', id })),
+    })
+    console.log('  ↕  Ordem do set atualizada')
+}
+
 // ─── Main ──────────────────────────────────────────────────────────────────
 console.log('\n📱  IronTracks — Upload de Screenshots para App Store\n')
 console.log(`  Modo: ${DRY ? 'DRY RUN' : 'LIVE'}`)
+console.log(`  Diff: ${FORCE ? '--force — envia tudo' : diffReport ? `${diffReport.unchanged?.length ?? 0} screenshot(s) sem mudança no relatório` : 'sem relatório — compara só o md5'}`)
 
 // 1. App
 console.log('\n→ Buscando app...')
@@ -172,12 +206,33 @@ for (const [deviceType, [tw, th]] of Object.entries(DEVICE_SIZES)) {
         console.log(`  ✓ Set criado (id=${set.id})`)
     }
 
-    // Deletar screenshots existentes
+    // Manter os que já estão no set com o mesmo conteúdo e entrega concluída
     const existShotsRes = await api('GET', `/v1/appScreenshotSets/${set.id}/appScreenshots?limit=30`)
     const existShots = existShotsRes?.data ?? []
-    if (existShots.length) {
-        console.log(`  Deletando ${existShots.length} screenshot(s) existente(s)...`)
-        for (const s of existShots) {
+    const kept = new Map()
+    const keptIds = new Set()
+    for (const fname of available) {
+        if (FORCE) break
+        const scaledName = fname.replace('.png', `_${deviceType}.png`)
+        const sums = acceptedChecksums(`${deviceType}/${scaledName}`, await fileMd5(path.join(folder, scaledName)))
+        const remote = existShots.find(s => !keptIds.has(s.id)
+            && sums.has(s.attributes.sourceFileChecksum)
+            && s.attributes.assetDeliveryState?.state === 'COMPLETE')
+        if (remote) { kept.set(fname, remote.id); keptIds.add(remote.id) }
+    }
+    const stale = existShots.filter(s => !keptIds.has(s.id))
+    // Ordem remota depois de apagar os stale: mantidos na ordem atual do set
+    const remoteOrder = existShots.filter(s => keptIds.has(s.id)).map(s => s.id)
+    if (kept.size === available.length && !stale.length) {
+        console.log(`  ⏭  ${kept.size} screenshot(s) sem mudança — nada a enviar`)
+        await syncOrder(set.id, available.map(f => kept.get(f)), remoteOrder)
+        continue
+    }
+
+    // Deletar screenshots existentes que serão substituídos
+    if (stale.length) {
+        console.log(`  Deletando ${stale.length} screenshot(s) existente(s)...`)
+        for (const s of stale) {
             await api('DELETE', `/v1/appScreenshots/${s.id}`)
             process.stdout.write('  🗑  ')
         }
@@ -186,11 +241,20 @@ for (const [deviceType, [tw, th]] of Object.entries(DEVICE_SIZES)) {
 
     // Upload
     let pos = 1
+    const order = []
+    const uploaded = []
     for (const fname of available) {
         const scaledName = fname.replace('.png', `_${deviceType}.png`)
         const filePath   = path.join(folder, scaledName)
         const fileSize   = statSync(filePath).size
 
+        if (kept.has(fname)) {
+            console.log(`  ⏭  ${fname} sem mudança — pos ${pos}`)
+            order.push(kept.get(fname))
+            pos++
+            continue
+        }
+
         // Reservar slot
         const reserve = await api('POST', '/v1/appScreenshots', {
             data: {
@@ -209,14 +273,18 @@ for (const [deviceType, [tw, th]] of Object.entries(DEVICE_SIZES)) {
         if (!ok) { console.log('❌'); continue }
 
         // Commit
-        const buf      = await readFileAsync(filePath)
-        const checksum = crypto.createHash('md5').update(buf).digest('hex')
+        const checksum = await fileMd5(filePath)
         const commit   = await api('PATCH', `/v1/appScreenshots/${shotId}`, {
             data: { type: 'appScreenshots', id: shotId, attributes: { sourceFileChecksum: checksum, uploaded: true } }
         })
         console.log(commit ? `✅ pos ${pos}` : '⚠️  commit incerto')
+        order.push(shotId)
+        uploaded.push(shotId)
         pos++
     }
+
+    // Novos uploads entram no fim do set, depois dos mantidos
+    await syncOrder(set.id, order, [...remoteOrder, ...uploaded])
 }
 
 console.log('\n✅  Concluído! Verifique em App Store Connect → Screenshots.\n')
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Redimensionamento compartilhado pelos scripts de imagem
+(scale-appstore-shots.py, create_review_screenshot.py, gen-carousel.py).
+
+Backends:
+  lanczos         Image.resize(LANCZOS) — referência de qualidade
+  reduce-lanczos  Image.reduce() inteiro + LANCZOS no resto (downscales grandes)
+  pyvips          libvips lanczos3 (se pyvips estiver instalado)
+  opencv          cv2.INTER_AREA / INTER_LANCZOS4 (se opencv-python estiver instalado)
+
+Por padrão (IRONTRACKS_RESAMPLE=default) a escolha é determinística:
+reduce-lanczos em downscales grandes, senão lanczos — a mesma entrada gera
+sempre os mesmos pixels, o que o diff-shots.py (tolerância 0) exige.
+
+  IRONTRACKS_RESAMPLE=auto      micro-benchmark num recorte da imagem escolhe
+                                o backend mais rápido com erro médio por pixel
+                                dentro de IRONTRACKS_RESAMPLE_TOLERANCE em
+                                relação ao LANCZOS. Depende do tempo medido:
+                                execuções diferentes podem gerar pixels
+                                diferentes. Escolha em cache por tipo de operação
+                                (modo + ampliação / downscale / downscale grande).
+  IRONTRACKS_RESAMPLE=<backend> força um backend
+
+Uso direto (tabela do benchmark):
+  python3 scripts/resampling.py screenshot-dashboard.png 1290x2796
+"""
+from PIL import Image, ImageChops, ImageStat
+import math
+import os
+import sys
+import time
+
+# LANCZOS final sempre recebe pelo menos 1.5x a resolução de saída:
+# reduce(floor(razão / 1.5)) já atua nos downscales 3x de capturas retina
+REDUCING_GAP = 1.5
+# A partir dessa razão o reduce() entra (fator >= 2)
+LARGE_DOWNSCALE = 2 * REDUCING_GAP
+
+MODE      = os.environ.get('IRONTRACKS_RESAMPLE', 'default')
+TOLERANCE = float(os.environ.get('IRONTRACKS_RESAMPLE_TOLERANCE', '1.0'))
+
+# Lado máximo (em px de saída) do recorte usado no benchmark — grande o
+# bastante para o tempo medido não ser só ruído (3x → ~1900px de origem)
+BENCH_CROP    = 640
+BENCH_REPEATS = 5
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    # OSError: pacote instalado sem a libvips nativa
+    pyvips = None
+
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
+
+def downscale_ratio(src_size, size):
+    sw, sh = src_size
+    tw, th = size
+    return min(sw / tw, sh / th)
+
+# ── Backends ───────────────────────────────────────────────────────
+
+def _lanczos(img, size):
+    return img.resize(size, Image.LANCZOS)
+
+def _reduce_lanczos(img, size):
+    factor = math.floor(downscale_ratio(img.size, size) / REDUCING_GAP)
+    if factor >= 2:
+        img = img.reduce(factor)
+    return img.resize(size, Image.LANCZOS)
+
+# RGBA é reamostrado com alfa pré-multiplicado, como o LANCZOS do Pillow;
+# sem isso a cor dos pixels transparentes vaza como franja escura nas bordas
+
+def _pyvips(img, size):
+    bands = len(img.getbands())
+    vi = pyvips.Image.new_from_memory(img.tobytes(), img.width, img.height, bands, 'uchar')
+    if img.mode == 'RGBA':
+        vi = vi.premultiply()
+    sx, sy = size[0] / vi.width, size[1] / vi.height
+    if sx < 1 or sy < 1:
+        vi = vi.resize(min(sx, 1), vscale=min(sy, 1), kernel='lanczos3')
+    # Ampliando, vips resize alinha os cantos e não os centros dos pixels
+    # (erro médio 2–5 contra o LANCZOS); affine com o deslocamento de centro
+    # do Pillow e borda replicada fica em ~0.5
+    sx, sy = size[0] / vi.width, size[1] / vi.height
+    if sx > 1 or sy > 1:
+        vi = vi.affine([sx, 0, 0, sy], interpolate=pyvips.Interpolate.new('bicubic'),
+                       odx=(sx - 1) / 2, ody=(sy - 1) / 2, oarea=[0, 0, *size], extend='copy')
+    if img.mode == 'RGBA':
+        vi = vi.unpremultiply()
+    vi = vi.cast('uchar')
+    out = Image.frombytes(img.mode, (vi.width, vi.height), vi.write_to_memory())
+    # vips arredonda a escala; corrige o eventual 1px de diferença
+    if out.size != size:
+        out = out.resize(size, Image.LANCZOS)
+    return out
+
+def _opencv(img, size):
+    interp = cv2.INTER_AREA if downscale_ratio(img.size, size) > 1 else cv2.INTER_LANCZOS4
+    if img.mode != 'RGBA':
+        return Image.fromarray(cv2.resize(np.asarray(img), size, interpolation=interp), img.mode)
+    arr = np.asarray(img, dtype=np.float32)
+    arr[..., :3] *= arr[..., 3:] / 255
+    out = cv2.resize(arr, size, interpolation=interp)
+    alpha = np.clip(out[..., 3:], 0, 255)
+    out[..., :3] = np.where(alpha > 0, out[..., :3] * 255 / np.maximum(alpha, 1e-6), 0)
+    out[..., 3:] = alpha
+    return Image.fromarray(np.clip(out + 0.5, 0, 255).astype(np.uint8), 'RGBA')
+
+BACKENDS = {
+    'lanczos':        _lanczos,
+    'reduce-lanczos': _reduce_lanczos,
+}
+if pyvips is not None:
+    BACKENDS['pyvips'] = _pyvips
+if cv2 is not None:
+    BACKENDS['opencv'] = _opencv
+
+# Modos que todos os backends tratam como bandas uint8
+NATIVE_MODES = ('L', 'RGB', 'RGBA')
+
+if MODE not in BACKENDS and MODE not in ('auto', 'default'):
+    print(f'  resampling: IRONTRACKS_RESAMPLE={MODE} indisponível '
+          f'(instalados: {", ".join(BACKENDS)}) — usando default', file=sys.stderr)
+    MODE = 'default'
+
+def _default_backend(src_size, size):
+    if downscale_ratio(src_size, size) >= LARGE_DOWNSCALE:
+        return 'reduce-lanczos'
+    return 'lanczos'
+
+# ── Benchmark ──────────────────────────────────────────────────────
+
+def _bench_crop(img, size):
+    """Recorte central da origem e tamanho de saída equivalente."""
+    sw, sh = img.size
+    tw, th = size
+    cw, ch = min(tw, BENCH_CROP), min(th, BENCH_CROP)
+    scw, sch = min(sw, round(cw * sw / tw)), min(sh, round(ch * sh / th))
+    left, top = (sw - scw) // 2, (sh - sch) // 2
+    return img.crop((left, top, left + scw, top + sch)), (cw, ch)
+
+def _mean_error(a, b):
+    diff = ImageStat.Stat(ImageChops.difference(a, b))
+    return sum(diff.mean) / len(diff.mean)
+
+def benchmark(img, size, backends=None):
+    """Retorna [(nome, segundos, erro_médio)] medidos num recorte da imagem."""
+    sample, sample_size = _bench_crop(img, size)
+    reference = _lanczos(sample, sample_size)
+    results = []
+    for name in backends or BACKENDS:
+        fn = BACKENDS[name]
+        try:
+            best = float('inf')
+            for _ in range(BENCH_REPEATS):
+                t0 = time.perf_counter()
+                out = fn(sample, sample_size)
+                best = min(best, time.perf_counter() - t0)
+        except Exception as e:
+            print(f'  resampling: backend {name} falhou no benchmark ({e})', file=sys.stderr)
+            continue
+        results.append((name, best, _mean_error(reference, out)))
+    return results
+
+def choose_backend(img, size, tolerance=TOLERANCE):
+    results = benchmark(img, size)
+    ok = [r for r in results if r[2] <= tolerance]
+    return min(ok, key=lambda r: r[1])[0] if ok else 'lanczos'
+
+_chosen = {}
+
+def backend_for(img, size):
+    if MODE in BACKENDS:
+        return MODE
+    if MODE == 'default':
+        return _default_backend(img.size, size)
+    # Backend dentro da tolerância num downscale pode não estar numa ampliação
+    ratio = downscale_ratio(img.size, size)
+    key = (img.mode, ratio < 1, ratio >= LARGE_DOWNSCALE)
+    if key not in _chosen:
+        _chosen[key] = choose_backend(img, size)
+    return _chosen[key]
+
+# ── API ────────────────────────────────────────────────────────────
+
+def resize(img, size):
+    """Substituto de img.resize(size, Image.LANCZOS) com backend plugável."""
+    size = (int(size[0]), int(size[1]))
+    if img.size == size:
+        return img.copy()
+    if img.mode not in NATIVE_MODES:
+        return _lanczos(img, size)
+    return BACKENDS[backend_for(img, size)](img, size)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print('uso: resampling.py <imagem> <LxA>')
+        sys.exit(1)
+    src = Image.open(sys.argv[1]).convert('RGB')
+    tw, th = (int(v) for v in sys.argv[2].lower().split('x'))
+    print(f'\n{src.width}×{src.height} → {tw}×{th}  (tolerância {TOLERANCE})\n')
+    for name, secs, err in sorted(benchmark(src, (tw, th)), key=lambda r: r[1]):
+        mark = '✓' if err <= TOLERANCE else '✗'
+        print(f'  {mark} {name:<15} {secs * 1000:8.2f} ms   erro {err:.3f}')
+    print(f'\n  default: {_default_backend(src.size, (tw, th))}   auto: {choose_backend(src, (tw, th))}\n')
@@ -6,6 +6,8 @@ exatas exigidas pela App Store (iPhone 6.7" / 6.9" / 6.5").
 from PIL import Image
 import os
 
+from resampling import resize
+
 BASE   = '/Volumes/SSD NVME 512GB/Projetos Antigravity/App IronTracks'
 SCALED = f'{BASE}/screenshots-appstore'
 
@@ -36,7 +38,7 @@ for device, (tw, th) in DEVICE_SIZES.items():
         sw, sh = img.size
         scale = max(tw / sw, th / sh)
         nw, nh = int(sw * scale), int(sh * scale)
-        img = img.resize((nw, nh), Image.LANCZOS)
+        img = resize(img, (nw, nh))
         left = (nw - tw) // 2
         top  = (nh - th) // 2
         img = img.crop((left, top, left + tw, top + th))